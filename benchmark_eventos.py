@@ -0,0 +1,150 @@
+"""
+Benchmark de GET /eventos/ sobre HTTP real.
+
+Arranca un worker de uvicorn con una base SQLite temporal, abre N conexiones SSE
+filtradas por ISBN y modifica el libro con PUT /libros/{id} a ritmo fijo. Mide:
+- eventos entregados frente a esperados (si el worker sostiene N suscriptores),
+- latencia de entrega (fecha del evento en el servidor hasta su lectura en el cliente),
+- latencia del PUT, que es lo que paga cada escritura por tener suscriptores.
+
+Uso: python benchmark_eventos.py [suscriptores ...]
+"""
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+import requests
+
+PUERTO = 8765
+URL = f"http://127.0.0.1:{PUERTO}"
+ISBN = "9780553383805"
+EVENTOS = 100
+INTERVALO = 0.02
+ESPERA_MAXIMA = 30
+
+
+def arrancar_servidor(directorio):
+    entorno = dict(os.environ, DATABASE_URL=f"sqlite:///{directorio}/benchmark.db")
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PUERTO), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=entorno
+    )
+    for _ in range(100):
+        try:
+            requests.get(URL, timeout=0.5)
+            return servidor
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    servidor.terminate()
+    sys.exit("El servidor no arrancó")
+
+
+def crear_libro():
+    requests.post(f"{URL}/autores/", data={"nombre": "Isabel Allende", "pais": "Chile", "anio_nacimiento": 1942})
+    requests.post(f"{URL}/libros/", data={
+        "titulo": "La casa de los espíritus",
+        "isbn": ISBN,
+        "anio_publicacion": 1982,
+        "copias_disponibles": 10,
+        "autores": "Isabel Allende"
+    }).raise_for_status()
+    return next(l["id"] for l in requests.get(f"{URL}/libros/").json() if l["isbn"] == ISBN)
+
+
+async def suscriptor(latencias, listo, total):
+    """
+    Cliente SSE mínimo sobre asyncio: lee la respuesta chunked y cuenta los eventos de stock.
+    """
+    lector, escritor = await asyncio.open_connection("127.0.0.1", PUERTO)
+    escritor.write(
+        f"GET /eventos/?isbn={ISBN} HTTP/1.1\r\nHost: 127.0.0.1\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    await escritor.drain()
+    while (await lector.readline()) not in (b"\r\n", b""):
+        pass
+
+    recibidos = 0
+    pendiente = ""
+    avisado = False
+    try:
+        while recibidos < total:
+            tamano = int((await lector.readline()).strip() or b"0", 16)
+            if tamano == 0:
+                break
+            pendiente += (await lector.readexactly(tamano)).decode()
+            await lector.readline()
+            ahora = time.time()
+            if not avisado:
+                # El primer bloque ("retry") indica que la suscripción ya está registrada
+                avisado = True
+                listo.release()
+            while "\n\n" in pendiente:
+                bloque, pendiente = pendiente.split("\n\n", 1)
+                for linea in bloque.split("\n"):
+                    if linea.startswith("data: ") and '"tipo":"stock"' in linea:
+                        fecha = datetime.fromisoformat(json.loads(linea[6:])["fecha"]).timestamp()
+                        latencias.append(ahora - fecha)
+                        recibidos += 1
+    finally:
+        escritor.close()
+
+
+def escritor_libro(libro_id, tiempos_put):
+    with requests.Session() as sesion:
+        for i in range(EVENTOS):
+            inicio = time.perf_counter()
+            sesion.put(f"{URL}/libros/{libro_id}", data={"copias_disponibles": 10 + i % 2}).raise_for_status()
+            tiempos_put.append(time.perf_counter() - inicio)
+            time.sleep(INTERVALO)
+
+
+async def medir(n, libro_id):
+    latencias, tiempos_put = [], []
+    listo = asyncio.Semaphore(0)
+    tareas = [asyncio.create_task(suscriptor(latencias, listo, EVENTOS)) for _ in range(n)]
+    for _ in range(n):
+        await listo.acquire()
+
+    hilo = threading.Thread(target=escritor_libro, args=(libro_id, tiempos_put))
+    hilo.start()
+    await asyncio.wait(tareas, timeout=ESPERA_MAXIMA)
+    await asyncio.to_thread(hilo.join)
+    for tarea in tareas:
+        tarea.cancel()
+    await asyncio.gather(*tareas, return_exceptions=True)
+    entregados = len(latencias)
+
+    latencias.sort()
+    p50 = statistics.median(latencias) * 1000 if latencias else float("nan")
+    p99 = latencias[max(int(len(latencias) * 0.99) - 1, 0)] * 1000 if latencias else float("nan")
+    put = statistics.median(tiempos_put) * 1000
+    print(f"{n:>6} suscriptores | entregados {entregados:>7}/{n * EVENTOS:<7} | "
+          f"p50 {p50:8.2f} ms | p99 {p99:8.2f} ms | PUT p50 {put:6.2f} ms")
+
+
+async def principal(niveles, libro_id):
+    for n in niveles:
+        await medir(n, libro_id)
+        await asyncio.sleep(1)
+
+
+if __name__ == "__main__":
+    niveles = [int(n) for n in sys.argv[1:]] or [10, 100, 1000, 2000]
+    suave, duro = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (duro, duro))
+
+    with tempfile.TemporaryDirectory() as directorio:
+        servidor = arrancar_servidor(directorio)
+        try:
+            asyncio.run(principal(niveles, crear_libro()))
+        finally:
+            servidor.terminate()
+            servidor.wait()
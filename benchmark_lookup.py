@@ -0,0 +1,86 @@
+"""
+Benchmark de las consultas por lote.
+
+Arranca un worker de uvicorn con una base SQLite temporal, registra libros y usuarios,
+y compara una sola llamada a POST /libros/lookup y /usuarios/lookup (por ids y por
+códigos) con N llamadas de un solo elemento, que es lo que hace hoy el mostrador por
+cada carrito.
+
+Uso: python benchmark_lookup.py [repeticiones]
+"""
+import statistics
+import sys
+import tempfile
+import time
+import requests
+from benchmark_eventos import URL, arrancar_servidor
+
+REPETICIONES = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+TAMANOS = [1, 10, 20, 50]
+REGISTROS = 60
+
+
+def poblar(sesion):
+    sesion.post(f"{URL}/autores/", data={"nombre": "Isabel Allende", "pais": "Chile", "anio_nacimiento": 1942})
+    isbns, codigos = [], []
+    for i in range(REGISTROS):
+        isbn = f"978{i:010d}"
+        sesion.post(f"{URL}/libros/", data={
+            "titulo": f"Libro {i:03d}",
+            "isbn": isbn,
+            "anio_publicacion": 1950 + i,
+            "copias_disponibles": 1 + i % 5,
+            "autores": "Isabel Allende"
+        }).raise_for_status()
+        isbns.append(isbn)
+
+        codigo = f"U{i:04d}"
+        sesion.post(f"{URL}/usuarios/usuarios", params={"nombre": f"Usuario {i:03d}", "codigo_unico": codigo}).raise_for_status()
+        codigos.append(codigo)
+
+    ids = [u["id"] for u in sesion.get(f"{URL}/usuarios/").json()]
+    return isbns, ids, codigos
+
+
+def cronometrar(funcion):
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def comparar(sesion, ruta, campo, claves):
+    print(f"\n{ruta} por {campo} ({len(claves)} registros)")
+    for n in TAMANOS:
+        lote = claves[:n]
+        if len(lote) < n:
+            print(f"  N={n:>3} | omitido: solo hay {len(claves)} registros")
+            continue
+
+        def individual():
+            for clave in lote:
+                sesion.post(f"{URL}{ruta}", json={campo: [clave]}).raise_for_status()
+
+        def por_lote():
+            sesion.post(f"{URL}{ruta}", json={campo: lote}).raise_for_status()
+
+        t_individual = cronometrar(individual)
+        t_lote = cronometrar(por_lote)
+        print(f"  N={n:>3} | {n} llamadas: {t_individual:8.2f} ms | 1 llamada: {t_lote:7.2f} ms | "
+              f"x{t_individual / t_lote:5.1f}")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directorio:
+        servidor = arrancar_servidor(directorio)
+        try:
+            with requests.Session() as sesion:
+                isbns, ids, codigos = poblar(sesion)
+                comparar(sesion, "/libros/lookup", "isbns", isbns)
+                comparar(sesion, "/usuarios/lookup", "ids", ids)
+                comparar(sesion, "/usuarios/lookup", "codigos", codigos)
+        finally:
+            servidor.terminate()
+            servidor.wait()
@@ -14,9 +14,19 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# SQLite admite como máximo 999 parámetros por consulta
+TAMANO_BLOQUE = 500
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def en_bloques(valores, tamano=TAMANO_BLOQUE):
+    """
+    Divide una lista en bloques para consultas IN (...) sin superar el límite de parámetros.
+    """
+    for i in range(0, len(valores), tamano):
+        yield valores[i:i + tamano]
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+
+CAPACIDAD_BUFFER = 1000
+
+
+class BusEventos:
+    """
+    Bus de eventos en memoria para notificar cambios de stock y de reservas.
+    Guarda los últimos eventos en un buffer acotado para poder reanudar
+    suscripciones con Last-Event-ID.
+    """
+
+    def __init__(self, capacidad: int = CAPACIDAD_BUFFER):
+        # Identifica este proceso: los ids de evento vuelven a empezar en cada arranque
+        self.arranque = uuid.uuid4().hex[:12]
+        self._buffer = deque(maxlen=capacidad)
+        self._ultimo_id = 0
+        self._lock = threading.Lock()
+        # Se toma alrededor de db.commit() y la publicación para que los eventos
+        # salgan en el mismo orden en que se confirmaron los cambios
+        self.orden = threading.Lock()
+        # Un conjunto de avisos por event loop, y los loops con un despertar ya programado
+        self._suscriptores = {}
+        self._pendientes = set()
+
+    @property
+    def ultimo_id(self) -> int:
+        return self._ultimo_id
+
+    def publicar(self, tipo: str, isbn: str, **datos) -> dict:
+        """
+        Registra un evento y despierta a los suscriptores.
+        Se puede llamar desde los endpoints síncronos (threadpool).
+        """
+        with self._lock:
+            self._ultimo_id += 1
+            evento = {
+                "id": self._ultimo_id,
+                "tipo": tipo,
+                "isbn": isbn,
+                "fecha": datetime.now(timezone.utc).isoformat(),
+                **datos
+            }
+            self._buffer.append(evento)
+            loops = [loop for loop in self._suscriptores if loop not in self._pendientes]
+            self._pendientes.update(loops)
+
+        # Una sola llamada por loop (todos los suscriptores de un worker comparten el mismo)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._despertar, loop)
+            except RuntimeError:
+                # El loop ya se cerró
+                with self._lock:
+                    self._suscriptores.pop(loop, None)
+                    self._pendientes.discard(loop)
+        return evento
+
+    def _despertar(self, loop):
+        with self._lock:
+            self._pendientes.discard(loop)
+            avisos = list(self._suscriptores.get(loop, ()))
+        for aviso in avisos:
+            aviso.set()
+
+    def eventos_desde(self, ultimo_id: int):
+        """
+        Devuelve los eventos posteriores a ultimo_id y si se perdieron eventos
+        porque ya salieron del buffer.
+        """
+        with self._lock:
+            # Se recorre desde el final: normalmente solo faltan unos pocos eventos
+            pendientes = []
+            for evento in reversed(self._buffer):
+                if evento["id"] <= ultimo_id:
+                    break
+                pendientes.append(evento)
+            pendientes.reverse()
+            perdidos = bool(self._buffer) and self._buffer[0]["id"] > ultimo_id + 1
+        return pendientes, perdidos
+
+    def suscribir(self):
+        aviso = asyncio.Event()
+        suscripcion = (asyncio.get_running_loop(), aviso)
+        with self._lock:
+            self._suscriptores.setdefault(suscripcion[0], set()).add(suscripcion[1])
+        return suscripcion
+
+    def cancelar(self, suscripcion):
+        loop, aviso = suscripcion
+        with self._lock:
+            avisos = self._suscriptores.get(loop)
+            if avisos is not None:
+                avisos.discard(aviso)
+                if not avisos:
+                    del self._suscriptores[loop]
+
+
+bus = BusEventos()
+
+
+def publicar_stock(libro, isbn_anterior=None):
+    if isbn_anterior and isbn_anterior != libro.isbn:
+        # Quien sigue el ISBN anterior no recibiría nada más de este libro
+        bus.publicar("cambio_isbn", isbn_anterior, isbn_nuevo=libro.isbn)
+    bus.publicar(
+        "stock",
+        libro.isbn,
+        copias_disponibles=libro.copias_disponibles,
+        activo=libro.activo
+    )
+
+
+def publicar_reserva(reserva, libro=None):
+    bus.publicar(
+        "reserva",
+        reserva.isbn_libro,
+        id_reserva=reserva.id,
+        estado=reserva.estado,
+        activo=reserva.activo,
+        copias_disponibles=libro.copias_disponibles if libro else None
+    )
@@ -7,11 +7,12 @@ Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title="Sistema de Gestión de Biblioteca")
 
-from routers import libros, autores, usuarios, reservas
+from routers import libros, autores, usuarios, reservas, eventos
 app.include_router(autores.router)
 app.include_router(libros.router)
 app.include_router(usuarios.router)
 app.include_router(reservas.router)
+app.include_router(eventos.router)
 
 @app.get("/")
 def inicio():
@@ -32,6 +33,7 @@ LIBROS
 POST   /libros/
 GET    /libros/
 GET    /libros/{libro_id}
+POST   /libros/lookup
 PUT    /libros/{libro_id}
 DELETE /libros/{libro_id}
 
@@ -39,6 +41,7 @@ USUARIOS
 POST   /usuarios/
 GET    /usuarios/
 GET    /usuarios/{usuario_id}
+POST   /usuarios/lookup
 PUT    /usuarios/{usuario_id}
 DELETE /usuarios/{usuario_id}
 
@@ -49,6 +52,9 @@ GET    /reservas/{id_reserva}
 PUT    /reservas/{id_reserva}
 DELETE /reservas/{id_reserva}
 
+EVENTOS
+GET    /eventos/?isbn=...   (Server-Sent Events)
+
 
 GET    /endpoints
 """
\ No newline at end of file
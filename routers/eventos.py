@@ -0,0 +1,98 @@
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+from eventos import bus, CAPACIDAD_BUFFER
+
+router = APIRouter(prefix="/eventos", tags=["Eventos"])
+
+INTERVALO_PING = 15
+
+
+def formatear_evento(evento: dict) -> str:
+    datos = json.dumps(evento, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {bus.arranque}-{evento['id']}\nevent: {evento['tipo']}\ndata: {datos}\n\n"
+
+
+def leer_last_event_id(last_event_id: Optional[str]) -> Optional[int]:
+    """
+    Devuelve el número de evento de un Last-Event-ID con formato "<arranque>-<n>",
+    o None si no es válido, pertenece a otro arranque del servidor o es un evento
+    que todavía no existe.
+    """
+    arranque, _, numero = (last_event_id or "").rpartition("-")
+    if arranque != bus.arranque or not numero.isdigit() or int(numero) > bus.ultimo_id:
+        return None
+    return int(numero)
+
+
+def formatear_ping(ultimo_id: int) -> str:
+    # El id actualiza el Last-Event-ID del cliente aunque el filtro haya omitido eventos
+    return f"id: {bus.arranque}-{ultimo_id}\n: ping\n\n"
+
+
+@router.get("/")
+async def suscribir_eventos(
+    isbn: Optional[str] = Query(None, description="ISBNs a seguir separados por coma (todos si se omite)"),
+    last_event_id: Optional[str] = Header(None, description="Último evento recibido, para reanudar la suscripción"),
+):
+    """
+    Flujo Server-Sent Events con los cambios de stock de libros y de estado de reservas.
+    Permite filtrar por ISBN y reanudar desde el último evento recibido.
+    """
+    filtro = {i.strip() for i in isbn.split(",") if i.strip()} if isbn else None
+
+    ultimo_id = leer_last_event_id(last_event_id)
+    reiniciar = last_event_id is not None and ultimo_id is None
+    if ultimo_id is None:
+        ultimo_id = bus.ultimo_id
+
+    async def generar():
+        nonlocal ultimo_id
+        suscripcion = bus.suscribir()
+        loop, aviso = suscripcion
+        # Último id que conoce el cliente
+        id_enviado = ultimo_id
+        proximo_ping = loop.time() + INTERVALO_PING
+        try:
+            yield "retry: 3000\n\n"
+            if reiniciar:
+                # El id es de otro arranque del servidor (o no es válido): el cliente debe recargar GET /libros/
+                yield "event: reinicio\ndata: {}\n\n"
+
+            while True:
+                aviso.clear()
+
+                pendientes, perdidos = bus.eventos_desde(ultimo_id)
+                if perdidos:
+                    # Los eventos ya salieron del buffer: el cliente debe recargar GET /libros/
+                    yield "event: reinicio\ndata: {}\n\n"
+
+                for evento in pendientes:
+                    ultimo_id = evento["id"]
+                    if filtro is None or evento["isbn"] in filtro:
+                        id_enviado = ultimo_id
+                        yield formatear_evento(evento)
+
+                # El ping sale cada INTERVALO_PING aunque haya tráfico de otros ISBN, y antes
+                # si el filtro omitió suficientes eventos como para que el id del cliente
+                # salga del buffer
+                if loop.time() >= proximo_ping or ultimo_id - id_enviado >= CAPACIDAD_BUFFER // 2:
+                    id_enviado = ultimo_id
+                    proximo_ping = loop.time() + INTERVALO_PING
+                    yield formatear_ping(ultimo_id)
+
+                try:
+                    await asyncio.wait_for(aviso.wait(), timeout=max(proximo_ping - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # StreamingResponse cancela el generador cuando el cliente se desconecta
+            bus.cancelar(suscripcion)
+
+    return StreamingResponse(
+        generar(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Form, Path
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional, List
+from pydantic import BaseModel, Field
 from models import Libro, Autor
-from database import get_db
+from database import get_db, en_bloques
+from eventos import bus, publicar_stock
 
 router = APIRouter(prefix="/libros", tags=["Libros"])
 
@@ -41,8 +43,10 @@ def crear_libro(
     )
 
     db.add(nuevo_libro)
-    db.commit()
-    db.refresh(nuevo_libro)
+    with bus.orden:
+        db.commit()
+        db.refresh(nuevo_libro)
+        publicar_stock(nuevo_libro)
 
     return {"mensaje": f"Libro '{titulo}' creado correctamente"}
 
@@ -70,6 +74,49 @@ def listar_libros(db: Session = Depends(get_db)):
     ]
 
 
+class ConsultaLibros(BaseModel):
+    isbns: List[str] = Field(..., min_length=1, max_length=1000, description="Lista de ISBN a consultar")
+
+
+@router.post("/lookup")
+def consultar_libros(consulta: ConsultaLibros, db: Session = Depends(get_db)):
+    """
+    Consulta varios libros por ISBN en una sola llamada, con disponibilidad y autores.
+    Los ISBN que no existen se devuelven en "faltantes".
+    """
+    isbns = list(dict.fromkeys(i.strip() for i in consulta.isbns if i.strip()))
+    if not isbns:
+        raise HTTPException(status_code=400, detail="Debe indicar al menos un ISBN válido")
+
+    encontrados = {}
+    for bloque in en_bloques(isbns):
+        libros = (
+            db.query(Libro)
+            .options(selectinload(Libro.autores))
+            .filter(Libro.isbn.in_(bloque))
+            .all()
+        )
+        for libro in libros:
+            encontrados[libro.isbn] = libro
+
+    return {
+        "libros": [
+            {
+                "id": libro.id,
+                "titulo": libro.titulo,
+                "isbn": libro.isbn,
+                "anio_publicacion": libro.anio_publicacion,
+                "copias_disponibles": libro.copias_disponibles,
+                "disponible": bool(libro.activo) and libro.copias_disponibles > 0,
+                "activo": libro.activo,
+                "autores": [a.nombre for a in libro.autores]
+            }
+            for libro in (encontrados[i] for i in isbns if i in encontrados)
+        ],
+        "faltantes": [i for i in isbns if i not in encontrados]
+    }
+
+
 @router.get("/buscar_por_anio/{anio_publicacion}")
 def buscar_libros_por_anio(
     anio_publicacion: int = Path(..., description="Año de publicación del libro"),
@@ -105,6 +152,8 @@ def actualizar_libro(
     if isbn and db.query(Libro).filter(Libro.isbn == isbn, Libro.id != libro_id).first():
         raise HTTPException(status_code=400, detail="Ya existe otro libro con ese ISBN")
 
+    isbn_anterior = libro.isbn
+
     if titulo:
         libro.titulo = titulo
     if isbn:
@@ -121,8 +170,10 @@ def actualizar_libro(
             raise HTTPException(status_code=400, detail="Algunos autores no existen o están inactivos")
         libro.autores = autores_nuevos
 
-    db.commit()
-    db.refresh(libro)
+    with bus.orden:
+        db.commit()
+        db.refresh(libro)
+        publicar_stock(libro, isbn_anterior)
 
     return {"mensaje": f"Libro '{libro.titulo}' actualizado correctamente"}
 
@@ -143,8 +194,10 @@ def eliminar_libro(libro_id: int, db: Session = Depends(get_db)):
     else:
         libro.activo = False
 
-    db.commit()
-    db.refresh(libro)
+    with bus.orden:
+        db.commit()
+        db.refresh(libro)
+        publicar_stock(libro)
 
     return {
         "mensaje": f"Libro '{libro.titulo}' actualizado tras eliminación de una copia.",
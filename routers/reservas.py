@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from models import Reserva, Usuario, Libro
 from database import get_db
+from eventos import bus, publicar_reserva
 
 router = APIRouter(prefix="/reservas", tags=["Reservas"])
 
@@ -66,8 +67,10 @@ def crear_reserva(usuario_id: int, isbn: str, db: Session = Depends(get_db)):
     libro.copias_disponibles -= 1
 
     db.add(nueva_reserva)
-    db.commit()
-    db.refresh(nueva_reserva)
+    with bus.orden:
+        db.commit()
+        db.refresh(nueva_reserva)
+        publicar_reserva(nueva_reserva, libro)
 
     return {
         "mensaje": "Reserva creada exitosamente",
@@ -153,13 +156,16 @@ def actualizar_reserva(
     db_reserva.estado = estado.lower()
 
     # Si se entrega o cancela, se libera una copia del libro
+    libro = None
     if db_reserva.estado in ["entregada", "cancelada"]:
         libro = db.query(Libro).filter(Libro.isbn == db_reserva.isbn_libro).first()
         if libro:
             libro.copias_disponibles += 1
 
-    db.commit()
-    db.refresh(db_reserva)
+    with bus.orden:
+        db.commit()
+        db.refresh(db_reserva)
+        publicar_reserva(db_reserva, libro)
 
     return {
         "mensaje": "Reserva actualizada correctamente",
@@ -179,10 +185,13 @@ def eliminar_reserva(id_reserva: int, db: Session = Depends(get_db)):
 
     reserva.activo = False
 
+    libro = None
     if reserva.estado == "activo":
         libro = db.query(Libro).filter(Libro.isbn == reserva.isbn_libro).first()
         if libro:
             libro.copias_disponibles += 1
 
-    db.commit()
+    with bus.orden:
+        db.commit()
+        publicar_reserva(reserva, libro)
     return {"mensaje": "Reserva eliminada ", "id_reserva": reserva.id}
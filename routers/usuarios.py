@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from typing import List
+from pydantic import BaseModel, Field
+from database import get_db, en_bloques
 from models import Usuario
 
 router = APIRouter(prefix="/usuarios", tags=["Usuarios"])
@@ -31,6 +33,43 @@ def listar_usuarios(db: Session = Depends(get_db)):
         for u in usuarios
     ]
 
+class ConsultaUsuarios(BaseModel):
+    ids: List[int] = Field([], max_length=1000, description="IDs de usuario a consultar")
+    codigos: List[str] = Field([], max_length=1000, description="Códigos únicos de usuario a consultar")
+
+@router.post("/lookup")
+def consultar_usuarios(consulta: ConsultaUsuarios, db: Session = Depends(get_db)):
+    ids = list(dict.fromkeys(consulta.ids))
+    codigos = list(dict.fromkeys(c.strip() for c in consulta.codigos if c.strip()))
+    if not ids and not codigos:
+        raise HTTPException(status_code=400, detail="Debe indicar al menos un id o código único")
+
+    por_id = {}
+    for bloque in en_bloques(ids):
+        for u in db.query(Usuario).filter(Usuario.id.in_(bloque)).all():
+            por_id[u.id] = u
+
+    por_codigo = {}
+    for bloque in en_bloques(codigos):
+        for u in db.query(Usuario).filter(Usuario.codigo_unico.in_(bloque)).all():
+            por_codigo[u.codigo_unico] = u
+
+    # En el orden pedido (primero ids, luego códigos); un usuario pedido por id y por código se devuelve una sola vez
+    encontrados = {}
+    for u in [por_id[i] for i in ids if i in por_id] + [por_codigo[c] for c in codigos if c in por_codigo]:
+        encontrados.setdefault(u.id, u)
+
+    return {
+        "usuarios": [
+            {"id": u.id, "nombre": u.nombre, "codigo_unico": u.codigo_unico, "activo": u.activo}
+            for u in encontrados.values()
+        ],
+        "faltantes": {
+            "ids": [i for i in ids if i not in por_id],
+            "codigos": [c for c in codigos if c not in por_codigo]
+        }
+    }
+
 @router.put("/{usuario_id}")
 def actualizar_usuario(
     usuario_id: int,